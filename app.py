@@ -6,6 +6,8 @@ and visualizes its tools, resources, and prompts.
 
 Install:
     pip install flask
+    pip install orjson    # optional, faster JSON
+    pip install waitress  # optional, production WSGI server
 
 Usage:
     python app.py -- npx -y @modelcontextprotocol/server-filesystem /tmp
@@ -16,172 +18,538 @@ Usage:
 Then open http://localhost:8080
 """
 
+import os
+import queue
+import re
 import sys
 import json
+import gzip
+import hashlib
 import argparse
+import functools
+import collections
+import itertools
 import subprocess
+import selectors
+import shutil
 import threading
+import time
 import webbrowser
-from flask import Flask, render_template, jsonify, request
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from flask import Flask, Response, request
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import waitress
+except ImportError:
+    waitress = None
+
+
+# ── JSON helpers ──
+
+def _dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and Infinity, which Python's json.dumps emits
+            pass
+    return json.loads(data)
 
 
 # ── MCP Client ──
 
+# Shared stand-in for omitted params/arguments; only ever serialized, never mutated
+_EMPTY: dict = {}
+
+
+def _frame(method: str, params: dict = None, msg_id: int = None) -> bytes:
+    """Encode one JSON-RPC message: a request when msg_id is given, else a notification."""
+    if msg_id is None:
+        msg = {"jsonrpc": "2.0", "method": method}
+        if params:
+            msg["params"] = params
+    else:
+        msg = {"jsonrpc": "2.0", "id": msg_id, "method": method, "params": params if params else _EMPTY}
+    return _dumps(msg)
+
+
+# The initialized notification never varies, so it is encoded once
+_INITIALIZED = _frame("notifications/initialized")
+
+# JSON-RPC error code for a method the server does not implement
+_METHOD_NOT_FOUND = -32601
+
+# Listing calls are quick for any healthy server; don't hold the page for 10 s
+_LIST_TIMEOUT = 3.0
+
+# LSP-style framing header; matched in place on the read buffer
+_CONTENT_LENGTH_RE = re.compile(rb"Content-Length:[ \t]*(\d+)[ \t]*\r\n", re.IGNORECASE)
+
+# The list_* calls fetched for the dashboard: (method, result key)
+_LISTINGS = (
+    ("tools/list", "tools"),
+    ("resources/list", "resources"),
+    ("resources/templates/list", "resourceTemplates"),
+    ("prompts/list", "prompts"),
+)
+
+# Server notifications that invalidate a cached list result
+_LIST_CHANGED = {
+    "notifications/tools/list_changed": "tools/list",
+    "notifications/resources/list_changed": "resources/list",
+    "notifications/resources/templates/list_changed": "resources/templates/list",
+    "notifications/prompts/list_changed": "prompts/list",
+}
+
+
+def _write_all(fd: int, buffers: list[bytes]):
+    """Write every buffer to fd, with a single gathered write where possible."""
+    if not hasattr(os, "writev"):
+        # Windows has no writev
+        buffers = [b"".join(buffers)]
+    while buffers:
+        written = os.writev(fd, buffers) if len(buffers) > 1 else os.write(fd, buffers[0])
+        # Drop the buffers that went out whole and trim a partially written one
+        i = 0
+        while i < len(buffers) and written >= len(buffers[i]):
+            written -= len(buffers[i])
+            i += 1
+        buffers = buffers[i:]
+        if written:
+            buffers[0] = buffers[0][written:]
+
+
 class MCPInspector:
     """Connects to an MCP server via stdio and introspects its capabilities."""
 
     def __init__(self, command: list[str]):
         self.command = command
         self.process = None
-        self._id = 0
-        self._lock = threading.Lock()
-        self._responses: dict = {}
+        # Id generation and single dict set/pop calls are atomic, so the
+        # request path and the reader share _responses without a lock.
+        self._ids = itertools.count(1)
+        self._responses: dict[int, Future] = {}
+        # Outgoing frames, drained in batches by _write_loop; None stops it
+        self._outbox: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer_thread = None
+        self._writer_closed = False
+        # Request counters reported by /api/metrics
+        self.stats = collections.Counter()
+        self._stats_lock = threading.Lock()
         self._reader_thread = None
+        self._echo_ok = True
         self.server_info = {}
         self.capabilities = {}
+        self.initialized = False
+        # method -> (fetched_at, listing) for the list_* calls. Listings rarely
+        # change, so entries live until the server sends list_changed or the
+        # caller asks for a refresh; set _cache_ttl to also expire them by age.
+        self._cache: dict = {}
+        self._cache_ttl: float | None = None
+        # Bumped per method on list_changed; a reply fetched under an older
+        # generation is returned but not cached, as it may predate the change
+        self._cache_gen = collections.Counter()
+        self._cache_lock = threading.Lock()
 
     def start(self):
+        # Passing a resolved executable path and close_fds=False lets CPython
+        # launch the server with posix_spawn instead of fork+exec, skipping the
+        # loop that closes every fd up to RLIMIT_NOFILE. This is safe because
+        # Python creates fds non-inheritable (PEP 446), so only the stdio pipes
+        # reach the child anyway.
         self.process = subprocess.Popen(
             self.command,
+            executable=shutil.which(self.command[0]) or self.command[0],
+            close_fds=False,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
+            # Both pipes are used through their raw fds (os.read/os.writev),
+            # so Python-level buffering would only add an unused copy
+            bufsize=0,
             text=False,
         )
+        # Grow the kernel pipe buffers so large replies and request bursts need
+        # fewer wakeups on either side (Linux only; best effort)
+        if fcntl is not None and hasattr(fcntl, "F_SETPIPE_SZ"):
+            for pipe in (self.process.stdin, self.process.stdout):
+                try:
+                    fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, 1 << 20)
+                except OSError:
+                    pass
         self._reader_thread = threading.Thread(target=self._read_loop, daemon=True)
         self._reader_thread.start()
-        # Forward server stderr so errors are visible in the dashboard terminal
-        self._stderr_thread = threading.Thread(target=self._stderr_loop, daemon=True)
-        self._stderr_thread.start()
+        self._writer_thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer_thread.start()
 
         result = self._send_request("initialize", {
             "protocolVersion": "2024-11-05",
             "capabilities": {},
             "clientInfo": {"name": "mcp-inspector", "version": "1.0.0"},
         })
-        if result:
+        if isinstance(result, dict) and "_error" not in result:
             self.server_info = result.get("serverInfo", {})
             self.capabilities = result.get("capabilities", {})
+            self.initialized = True
 
-        self._send_notification("notifications/initialized", {})
+        self._write(_INITIALIZED)
 
     def stop(self):
-        if self.process:
-            self.process.terminate()
-            self.process.wait(timeout=5)
+        self._fail_pending()
+        self._outbox.put(None)
+        if not self.process:
+            return
+        if self._writer_thread:
+            self._writer_thread.join(timeout=0.5)
+        # EOF on stdin lets servers that exit on it shut down on their own;
+        # anything still running after a short grace period is terminated,
+        # then killed
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=0.5)
+            return
+        except subprocess.TimeoutExpired:
+            pass
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=0.5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait(timeout=1.0)
 
     # ── JSON-RPC transport ──
 
     def _next_id(self):
-        with self._lock:
-            self._id += 1
-            return self._id
+        return next(self._ids)
 
     def _send_request(self, method: str, params: dict = None, timeout: float = 10.0):
-        msg_id = self._next_id()
-        msg = {"jsonrpc": "2.0", "id": msg_id, "method": method, "params": params if params is not None else {}}
-
-        event = threading.Event()
-        result_holder = [None]
-
-        with self._lock:
-            self._responses[msg_id] = (event, result_holder)
-
-        raw = json.dumps(msg) + "\n"
-        try:
-            self.process.stdin.write(raw.encode("utf-8"))
-            self.process.stdin.flush()
-        except (BrokenPipeError, OSError):
-            return None
-
-        if event.wait(timeout=timeout):
-            return result_holder[0]
-        return None
+        return self._send_many([(method, params)], timeout=timeout)[0]
+
+    def _send_many(self, requests: list[tuple[str, dict]], timeout: float = 10.0) -> list:
+        """Pipeline several requests in one write and wait for all their replies.
+
+        Replies are matched by id, so the server can work on them concurrently.
+        A request that can't be sent or times out yields None.
+        """
+        pending = []
+        frames = []
+        for method, params in requests:
+            msg_id = self._next_id()
+            reply = Future()
+            self._responses[msg_id] = reply
+            pending.append((msg_id, reply))
+            frames.append(_frame(method, params, msg_id))
+
+        self._count("requests", len(frames))
+        if not self._write(*frames):
+            for msg_id, _ in pending:
+                self._responses.pop(msg_id, None)
+            self._count("send_failures", len(frames))
+            return [None] * len(frames)
+
+        deadline = time.monotonic() + timeout
+        results = []
+        for msg_id, reply in pending:
+            try:
+                result = reply.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeout:
+                self._responses.pop(msg_id, None)
+                self._count("timeouts")
+                result = None
+            if isinstance(result, dict) and "_error" in result:
+                self._count("errors")
+            results.append(result)
+        return results
 
     def _send_notification(self, method: str, params: dict = None):
-        msg = {"jsonrpc": "2.0", "method": method}
-        if params:
-            msg["params"] = params
-        raw = json.dumps(msg) + "\n"
-        try:
-            self.process.stdin.write(raw.encode("utf-8"))
-            self.process.stdin.flush()
-        except (BrokenPipeError, OSError):
-            pass
+        self._write(_frame(method, params))
+
+    def _write(self, *raws: bytes) -> bool:
+        """Queue frames for the writer thread; False once the pipe has failed."""
+        if self._writer_closed:
+            return False
+        for raw in raws:
+            self._outbox.put(raw)
+        return True
+
+    def _write_loop(self):
+        # Frames queued while a write is in progress go out together in the
+        # next gathered write, so a burst of requests costs one syscall
+        # instead of one write+flush each.
+        fd = self.process.stdin.fileno()
+        while True:
+            frames = [self._outbox.get()]
+            while len(frames) < 512:
+                try:
+                    frames.append(self._outbox.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = None in frames
+            buffers = []
+            for frame in frames:
+                if frame is not None:
+                    buffers += (frame, b"\n")
+            try:
+                _write_all(fd, buffers)
+            except OSError:
+                self._fail_pending()
+                return
+            if stopping:
+                return
+
+    def _fail_pending(self):
+        # The server is gone: fail waiting requests instead of letting them run
+        # into their timeouts. The flag goes first so that a request registered
+        # after the sweep is refused by _write rather than left waiting.
+        self._writer_closed = True
+        for msg_id in list(self._responses):
+            reply = self._responses.pop(msg_id, None)
+            if reply is not None:
+                reply.set_result(None)
+
+    def _count(self, name: str, n: int = 1):
+        with self._stats_lock:
+            self.stats[name] += n
 
     def _read_loop(self):
-        # MCP stdio uses newline-delimited JSON (one JSON-RPC message per line)
-        buf = b""
-        while self.process and self.process.poll() is None:
-            try:
-                chunk = self.process.stdout.read(1)
-                if not chunk:
-                    break
-                buf += chunk
-
-                while b"\n" in buf or b"\r" in buf:
-                    line_end = buf.find(b"\n")
-                    if line_end == -1:
-                        line_end = buf.find(b"\r")
-                    if line_end == -1:
-                        break
-                    line = buf[:line_end].decode("utf-8").strip()
-                    buf = buf[line_end + 1:]
-                    if line.startswith("Content-Length:"):
+        # One thread services both server pipes: a selector watches stdout and
+        # stderr and each ready fd is read in 64 KiB chunks. Windows can't
+        # select on pipes, so there stdout is read with blocking reads and
+        # stderr gets its own thread.
+        out_fd = self.process.stdout.fileno()
+        err_fd = self.process.stderr.fileno()
+        buf = bytearray()
+        err_buf = bytearray()
+        read_pos = scan_pos = 0
+        with selectors.DefaultSelector() as sel:
+            if os.name == "nt":
+                sel = None
+                threading.Thread(target=self._stderr_loop, daemon=True).start()
+            else:
+                for fd in (out_fd, err_fd):
+                    os.set_blocking(fd, False)
+                    sel.register(fd, selectors.EVENT_READ)
+            while True:
+                ready = (out_fd,) if sel is None else [key.fd for key, _ in sel.select()]
+                for fd in ready:
+                    try:
+                        chunk = os.read(fd, 65536)
+                    except BlockingIOError:
                         continue
-                    if not line:
+                    except OSError:
+                        chunk = b""
+
+                    if fd == err_fd:
+                        if chunk:
+                            err_buf += chunk
+                            line_end = err_buf.rfind(b"\n") + 1
+                        else:
+                            sel.unregister(err_fd)
+                            line_end = len(err_buf)
+                        if line_end:
+                            self._echo_stderr(bytes(err_buf[:line_end]))
+                            del err_buf[:line_end]
                         continue
-                    try:
-                        data = json.loads(line)
-                        msg_id = data.get("id")
-                        if msg_id is not None:
-                            with self._lock:
-                                if msg_id in self._responses:
-                                    event, holder = self._responses.pop(msg_id)
-                                    if "result" in data:
-                                        holder[0] = data["result"]
-                                    elif "error" in data:
-                                        holder[0] = {"_error": data["error"]}
-                                    event.set()
-                    except json.JSONDecodeError:
-                        pass
-            except Exception:
+
+                    if not chunk:
+                        self._fail_pending()
+                        return
+                    buf += chunk
+                    read_pos, scan_pos = self._parse_messages(buf, read_pos, scan_pos)
+
+    def _parse_messages(self, buf: bytearray, read_pos: int, scan_pos: int) -> tuple[int, int]:
+        """Dispatch every complete message in buf and return the new offsets."""
+        # MCP stdio uses newline-delimited JSON (one JSON-RPC message per line),
+        # but some servers frame messages LSP-style with a Content-Length header.
+        # read_pos marks the start of the unconsumed data and scan_pos where the
+        # last newline search stopped, so consumed lines are never copied and no
+        # byte is scanned twice. The buffer is reset when fully consumed and
+        # otherwise compacted only past 32 KiB of consumed data.
+        while True:
+            header = _CONTENT_LENGTH_RE.match(buf, read_pos)
+            if header:
+                # Any other header lines (e.g. Content-Type) end at the blank line
+                header_end = buf.find(b"\r\n\r\n", header.end() - 2)
+                if header_end == -1:
+                    break
+                body_start = header_end + 4
+                body_end = body_start + int(header.group(1))
+                if body_end > len(buf):
+                    break
+                self._dispatch(buf[body_start:body_end])
+                read_pos = scan_pos = body_end
+                continue
+
+            line_end = buf.find(b"\n", scan_pos)
+            if line_end == -1:
                 break
+            line = buf[read_pos:line_end].strip()
+            read_pos = scan_pos = line_end + 1
+            if line:
+                self._dispatch(line)
+
+        scan_pos = len(buf)
+        if read_pos == scan_pos:
+            buf.clear()
+            return 0, 0
+        if read_pos > 32768:
+            del buf[:read_pos]
+            return 0, scan_pos - read_pos
+        return read_pos, scan_pos
+
+    def _dispatch(self, line: bytes):
+        try:
+            data = _loads(line)
+        except ValueError:
+            return
+        # A JSON-RPC batch reply is an array of individual messages
+        for message in data if isinstance(data, list) else (data,):
+            if isinstance(message, dict):
+                self._handle_message(message)
+
+    def _handle_message(self, data: dict):
+        msg_id = data.get("id")
+        if msg_id is not None:
+            reply = self._responses.pop(msg_id, None)
+            if reply is not None:
+                if "result" in data:
+                    reply.set_result(data["result"])
+                elif "error" in data:
+                    reply.set_result({"_error": data["error"]})
+                else:
+                    reply.set_result(None)
+        elif data.get("method") in _LIST_CHANGED:
+            method = _LIST_CHANGED[data["method"]]
+            with self._cache_lock:
+                self._cache_gen[method] += 1
+                self._cache.pop(method, None)
 
     def _stderr_loop(self):
-        if self.process and self.process.stderr:
-            try:
-                for line in iter(self.process.stderr.readline, b""):
-                    if line:
-                        sys.stderr.write(f"[MCP server] {line.decode('utf-8', errors='replace')}")
-                        sys.stderr.flush()
-            except Exception:
-                pass
+        # Only used where the reader can't select on pipes (Windows)
+        fd = self.process.stderr.fileno()
+        pending = b""
+        try:
+            for chunk in iter(lambda: os.read(fd, 65536), b""):
+                pending += chunk
+                line_end = pending.rfind(b"\n") + 1
+                if line_end:
+                    self._echo_stderr(pending[:line_end])
+                    pending = pending[line_end:]
+        except OSError:
+            pass
+        if pending:
+            self._echo_stderr(pending)
+
+    def _echo_stderr(self, data: bytes):
+        # Forward server stderr so errors are visible in the dashboard terminal.
+        # Callers keep draining even once forwarding fails: a server blocked on
+        # a full stderr pipe stops answering requests too.
+        if not self._echo_ok:
+            return
+        text = data.decode("utf-8", errors="replace")
+        try:
+            sys.stderr.write("".join(f"[MCP server] {line}\n" for line in text.rstrip("\n").split("\n")))
+            sys.stderr.flush()
+        except Exception:
+            self._echo_ok = False
 
     # ── Public query methods ──
 
-    def list_tools(self):
-        result = self._send_request("tools/list", {})
-        if not result or "_error" in result:
-            return []
-        return result.get("tools", result.get("tool", []))
-
-    def list_resources(self):
-        result = self._send_request("resources/list", {})
-        if not result or "_error" in result:
-            return []
-        return result.get("resources", result.get("resource", []))
+    def _cache_get(self, method: str):
+        entry = self._cache.get(method)
+        if entry and (self._cache_ttl is None or time.monotonic() - entry[0] < self._cache_ttl):
+            return entry[1]
+        return None
 
-    def list_prompts(self):
-        result = self._send_request("prompts/list", {})
-        if not result or "_error" in result:
-            return []
-        return result.get("prompts", result.get("prompt", []))
+    def _listing(self, method: str, key: str, result, gen: int):
+        """Return ``{key: [...], "error": None}``, or an empty list and the error message."""
+        if result is None:
+            return {key: [], "error": "No response"}
+        if not isinstance(result, dict):
+            return {key: [], "error": "Malformed response"}
+        if "_error" in result:
+            # JSON-RPC says error is an object, but not every server complies
+            err = result["_error"]
+            code = err.get("code") if isinstance(err, dict) else None
+            if code != _METHOD_NOT_FOUND:
+                message = err.get("message") if isinstance(err, dict) else None
+                return {key: [], "error": message or "Request failed"}
+            # Servers often advertise "resources" without implementing
+            # templates; cache that as an empty listing rather than asking again
+            listing = {key: [], "error": None}
+        else:
+            listing = {key: result.get(key, result.get(key[:-1], [])), "error": None}
+        with self._cache_lock:
+            if self._cache_gen[method] == gen:
+                self._cache[method] = (time.monotonic(), listing)
+        return listing
+
+    def _advertises(self, method: str) -> bool:
+        # "resources/templates/list" falls under the "resources" capability.
+        # Without a successful handshake nothing is known, so ask anyway.
+        return not self.initialized or method.split("/", 1)[0] in self.capabilities
+
+    def _fetch_listings(self, methods, refresh: bool = False):
+        """Return the listings for (method, key) pairs by key, one pipelined write for the misses."""
+        listings = {}
+        missing = []
+        for method, key in methods:
+            if not self._advertises(method):
+                listings[key] = {key: [], "error": None}
+                continue
+            listings[key] = None if refresh else self._cache_get(method)
+            if listings[key] is None:
+                missing.append((method, key))
+        if missing:
+            gens = [self._cache_gen[method] for method, _ in missing]
+            results = self._send_many([(method, None) for method, _ in missing], timeout=_LIST_TIMEOUT)
+            for (method, key), result, gen in zip(missing, results, gens):
+                listings[key] = self._listing(method, key, result, gen)
+        return listings
+
+    def _cached_list(self, method: str, key: str, refresh: bool = False):
+        return self._fetch_listings(((method, key),), refresh)[key]
+
+    def list_tools(self, refresh: bool = False):
+        return self._cached_list("tools/list", "tools", refresh)
+
+    def list_resources(self, refresh: bool = False):
+        return self._cached_list("resources/list", "resources", refresh)
+
+    def list_prompts(self, refresh: bool = False):
+        return self._cached_list("prompts/list", "prompts", refresh)
+
+    def list_resource_templates(self, refresh: bool = False):
+        return self._cached_list("resources/templates/list", "resourceTemplates", refresh)
+
+    def list_all(self, refresh: bool = False):
+        """Fetch every listing, pipelining whatever isn't cached."""
+        return self._fetch_listings(_LISTINGS, refresh)
 
     def call_tool(self, name: str, arguments: dict = None):
         return self._send_request("tools/call", {
             "name": name,
-            "arguments": arguments or {},
+            "arguments": arguments if arguments else _EMPTY,
         }, timeout=30.0)
 
     def read_resource(self, uri: str):
@@ -190,83 +558,175 @@ class MCPInspector:
     def get_prompt(self, name: str, arguments: dict = None):
         return self._send_request("prompts/get", {
             "name": name,
-            "arguments": arguments or {},
+            "arguments": arguments if arguments else _EMPTY,
         })
 
 
 # ── Flask App ──
 
 app = Flask(__name__)
+# The page has no template variables, so it and its assets are served as
+# static files that browsers may cache.
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 3600
 inspector: MCPInspector = None
 
+# index.html is read once; "/" serves these bytes without touching the disk
+with open(os.path.join(app.static_folder, "index.html"), "rb") as f:
+    _INDEX_HTML = f.read()
+_INDEX_ETAG = hashlib.blake2b(_INDEX_HTML, digest_size=8).hexdigest()
+# Compressed once too, so gzip-capable clients cost no per-request work either
+_INDEX_HTML_GZ = gzip.compress(_INDEX_HTML, compresslevel=9)
+
+
+@app.after_request
+def _compress(resp):
+    # Tool output and resource contents can run to megabytes of JSON; gzip at
+    # level 1 shrinks them several-fold for little CPU. Small bodies and
+    # static files (sent with direct passthrough) go out as they are.
+    if (resp.status_code != 200 or resp.direct_passthrough or resp.is_streamed
+            or "Content-Encoding" in resp.headers or not request.accept_encodings["gzip"]):
+        return resp
+    body = resp.get_data()
+    if len(body) < 1400:
+        return resp
+    resp.set_data(gzip.compress(body, compresslevel=1))
+    resp.headers["Content-Encoding"] = "gzip"
+    resp.vary.add("Accept-Encoding")
+    etag, weak = resp.get_etag()
+    if etag and not weak:
+        # The compressed body is a different representation of the same page
+        resp.set_etag(etag, weak=True)
+    return resp
+
+
+def _json_response(obj):
+    # Encode with _dumps directly rather than through jsonify, which always
+    # uses the stdlib encoder and sorts every object's keys.
+    return Response(_dumps(obj), mimetype="application/json")
+
 
 @app.route("/")
 def index():
-    return render_template("index.html")
+    if request.accept_encodings["gzip"]:
+        resp = Response(_INDEX_HTML_GZ, mimetype="text/html")
+        resp.headers["Content-Encoding"] = "gzip"
+        resp.set_etag(_INDEX_ETAG, weak=True)
+    else:
+        resp = Response(_INDEX_HTML, mimetype="text/html")
+        resp.set_etag(_INDEX_ETAG)
+    resp.vary.add("Accept-Encoding")
+    resp.cache_control.public = True
+    resp.cache_control.max_age = 3600
+    return resp.make_conditional(request)
+
+
+def _request_json():
+    # Parse the body with _loads (orjson when installed) instead of Flask's
+    # request.json; a malformed body yields {} and surfaces as a missing field.
+    try:
+        return _loads(request.get_data())
+    except ValueError:
+        return {}
+
+
+def _refresh_requested():
+    # Listings are cached; ?refresh=1 fetches them from the server again
+    return request.args.get("refresh") == "1"
+
+
+def _server_info(mcp: MCPInspector):
+    return {
+        "name": mcp.server_info.get("name", "Unknown"),
+        "version": mcp.server_info.get("version", ""),
+        "capabilities": mcp.capabilities,
+        "command": " ".join(mcp.command),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _info_json(mcp: MCPInspector) -> bytes:
+    # Server info is fixed once the handshake is done, so encode it once per inspector
+    return _dumps(_server_info(mcp))
 
 
 @app.route("/api/info")
 def api_info():
-    return jsonify({
-        "name": inspector.server_info.get("name", "Unknown"),
-        "version": inspector.server_info.get("version", ""),
-        "capabilities": inspector.capabilities,
-        "command": " ".join(inspector.command),
+    return Response(_info_json(inspector), mimetype="application/json")
+
+
+@app.route("/api/bootstrap")
+def api_bootstrap():
+    # The list calls are pipelined, so page load waits for the slowest reply
+    # instead of the sum of all of them.
+    listings = inspector.list_all(_refresh_requested())
+    tools, resources, prompts = listings["tools"], listings["resources"], listings["prompts"]
+    templates = listings["resourceTemplates"]
+    return _json_response({
+        "info": _server_info(inspector),
+        "tools": tools["tools"],
+        "resources": resources["resources"],
+        "templates": templates["resourceTemplates"],
+        "prompts": prompts["prompts"],
+        "errors": {
+            "tools": tools["error"],
+            "resources": resources["error"],
+            "templates": templates["error"],
+            "prompts": prompts["error"],
+        },
     })
 
 
 @app.route("/api/tools")
 def api_tools():
-    try:
-        return jsonify(inspector.list_tools())
-    except Exception:
-        return jsonify([])
+    return _json_response(inspector.list_tools(_refresh_requested()))
 
 
 @app.route("/api/resources")
 def api_resources():
-    try:
-        return jsonify(inspector.list_resources())
-    except Exception:
-        return jsonify([])
+    return _json_response(inspector.list_resources(_refresh_requested()))
+
+
+@app.route("/api/resources/templates")
+def api_resource_templates():
+    return _json_response(inspector.list_resource_templates(_refresh_requested()))
 
 
 @app.route("/api/prompts")
 def api_prompts():
-    try:
-        return jsonify(inspector.list_prompts())
-    except Exception:
-        return jsonify([])
+    return _json_response(inspector.list_prompts(_refresh_requested()))
 
 
-@app.route("/api/tools/call", methods=["POST"])
-def api_call_tool():
-    data = request.json
-    try:
-        result = inspector.call_tool(data["name"], data.get("arguments", {}))
-        return jsonify(result or {"error": "No response"})
-    except Exception as e:
-        return jsonify({"error": str(e)})
+@app.route("/api/metrics")
+def api_metrics():
+    return _json_response({
+        **inspector.stats,
+        "pending": len(inspector._responses),
+    })
 
 
-@app.route("/api/resources/read", methods=["POST"])
-def api_read_resource():
-    data = request.json
-    try:
-        result = inspector.read_resource(data["uri"])
-        return jsonify(result or {"error": "No response"})
-    except Exception as e:
-        return jsonify({"error": str(e)})
+# POST /api/<action> -> (MCPInspector method, required body fields, optional body fields)
+_ACTIONS = {
+    "tools/call": ("call_tool", ("name",), ("arguments",)),
+    "resources/read": ("read_resource", ("uri",), ()),
+    "prompts/get": ("get_prompt", ("name",), ("arguments",)),
+}
 
 
-@app.route("/api/prompts/get", methods=["POST"])
-def api_get_prompt():
-    data = request.json
+def api_action(action):
+    method, required, optional = _ACTIONS[action]
+    data = _request_json()
     try:
-        result = inspector.get_prompt(data["name"], data.get("arguments", {}))
-        return jsonify(result or {"error": "No response"})
+        args = [data[field] for field in required] + [data.get(field) for field in optional]
+        result = getattr(inspector, method)(*args)
+        return _json_response(result or {"error": "No response"})
     except Exception as e:
-        return jsonify({"error": str(e)})
+        return _json_response({"error": str(e)})
+
+
+# One explicit rule per action, so other /api paths keep their 404/405 responses
+for _action in _ACTIONS:
+    app.add_url_rule(f"/api/{_action}", "api_action", api_action,
+                     methods=["POST"], defaults={"action": _action})
 
 
 # ── CLI Entry Point ──
@@ -278,6 +738,8 @@ def main():
     )
     parser.add_argument("--port", type=int, default=8080, help="Port for web UI (default: 8080)")
     parser.add_argument("--no-open", action="store_true", help="Don't auto-open browser")
+    parser.add_argument("--threads", type=int, default=16,
+                        help="Worker threads when served by waitress (default: 16)")
 
     argv = sys.argv[1:]
     if "--" in argv:
@@ -327,7 +789,12 @@ def main():
         threading.Timer(1.0, lambda: webbrowser.open(f"http://localhost:{args.port}")).start()
 
     try:
-        app.run(host="0.0.0.0", port=args.port, debug=False)
+        # Tool calls can block for up to 30 s, so serve requests on a thread
+        # pool; waitress is preferred when installed.
+        if waitress is not None:
+            waitress.serve(app, host="0.0.0.0", port=args.port, threads=args.threads)
+        else:
+            app.run(host="0.0.0.0", port=args.port, debug=False, threaded=True)
     finally:
         inspector.stop()
 
@@ -8,126 +8,144 @@ document.querySelectorAll('.tab').forEach(tab => {
   });
 });
 
+const ESC = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+
 function escHtml(s) {
-  const d = document.createElement('div');
-  d.textContent = s || '';
-  return d.innerHTML;
+  return String(s || '').replace(/[&<>"']/g, c => ESC[c]);
+}
+
+function emptyError(error) {
+  return error ? `<div style="font: 400 11px var(--mono); color: var(--rose); margin-top: 8px;">${escHtml(error)}</div>` : '';
+}
+
+// ── Card Templates ──
+// Cards are cloned from <template> nodes in index.html and filled in with
+// textContent, so the markup is parsed once and server strings never pass
+// through the HTML parser.
+function cloneTemplate(id) {
+  return document.getElementById(id).content.firstElementChild.cloneNode(true);
+}
+
+function fillCard(card, name, desc) {
+  card.querySelector('.card-name').textContent = name;
+  card.querySelector('.card-desc').textContent = desc || 'No description';
+}
+
+function setCount(card, n, noun) {
+  const el = card.querySelector('.card-count');
+  if (!n) {
+    el.remove();
+    card.querySelector('.schema-block').remove();
+    return;
+  }
+  el.textContent = `${n} ${noun}${n > 1 ? 's' : ''}`;
+}
+
+function setMime(card, mimeType) {
+  const el = card.querySelector('.card-mime');
+  if (mimeType) el.textContent = mimeType;
+  else el.remove();
+}
+
+function paramRow(name, required, description) {
+  const row = cloneTemplate('tpl-param');
+  row.querySelector('.param-name').textContent = name;
+  if (!required) row.querySelector('.param-req').remove();
+  const input = row.querySelector('.param-input');
+  input.dataset.param = name;
+  input.placeholder = (description || name).slice(0, 60);
+  return row;
+}
+
+function renderEmpty(grid, icon, message, error) {
+  grid.innerHTML = `<div class="empty"><div class="empty-icon">${icon}</div>${message}${emptyError(error)}</div>`;
 }
 
 // ── Render Tools ──
-function renderTools(tools) {
+function renderTools(tools, error) {
   const grid = document.getElementById('grid-tools');
   document.getElementById('loading-tools').style.display = 'none';
 
   if (!tools.length) {
-    grid.innerHTML = '<div class="empty"><div class="empty-icon">⚡</div>No tools exposed by this server</div>';
+    renderEmpty(grid, '⚡', 'No tools exposed by this server', error);
     return;
   }
 
-  grid.innerHTML = tools.map((t, i) => {
-    const schema = t.inputSchema;
-    const props = schema?.properties || {};
-    const required = schema?.required || [];
-    const paramCount = Object.keys(props).length;
-
-    let paramsHtml = '';
-    if (paramCount) {
-      paramsHtml = '<div class="schema-block">' + Object.entries(props).map(([name, prop]) => {
-        const isReq = required.includes(name);
-        const ph = (prop.description || name).slice(0, 60);
-        return `<div class="param-row">
-          <label class="param-label"><span class="param-name">${escHtml(name)}</span> ${isReq ? '<span class="param-req">REQUIRED</span>' : ''}</label>
-          <input class="param-input" data-param="${escHtml(name)}" placeholder="${escHtml(ph)}" />
-        </div>`;
-      }).join('') + '</div>';
+  const frag = document.createDocumentFragment();
+  for (const t of tools) {
+    const card = cloneTemplate('tpl-tool');
+    const props = t.inputSchema?.properties || {};
+    const required = t.inputSchema?.required || [];
+    const names = Object.keys(props);
+    card.dataset.toolName = t.name;
+    fillCard(card, t.name, t.description);
+    setCount(card, names.length, 'parameter');
+    const block = card.querySelector('.schema-block');
+    for (const name of names) {
+      block.appendChild(paramRow(name, required.includes(name), props[name].description));
     }
-
-    return `<div class="card" data-tool-name="${escHtml(t.name)}">
-      <div class="card-head">
-        <div class="card-icon tool">⚡</div>
-        <div class="card-info">
-          <div class="card-name">${escHtml(t.name)}</div>
-          <div class="card-desc">${escHtml(t.description || 'No description')}</div>
-        </div>
-      </div>
-      <div class="card-body">
-        ${paramCount ? `<div style="font: 500 10px var(--mono); color: var(--tx-3); letter-spacing: 1px; text-transform: uppercase; margin-bottom: 2px;">${paramCount} parameter${paramCount > 1 ? 's' : ''}</div>` : ''}
-        ${paramsHtml}
-        <button class="try-btn" onclick="tryTool(this)">▶ Try it</button>
-        <div class="result-block" id="result-tool-${i}"></div>
-      </div>
-    </div>`;
-  }).join('');
+    frag.appendChild(card);
+  }
+  grid.replaceChildren(frag);
 }
 
 // ── Render Resources ──
-function renderResources(resources) {
+function renderResources(resources, templates, error) {
   const grid = document.getElementById('grid-resources');
   document.getElementById('loading-resources').style.display = 'none';
 
-  if (!resources.length) {
-    grid.innerHTML = '<div class="empty"><div class="empty-icon">◆</div>No resources exposed by this server</div>';
+  if (!resources.length && !templates.length) {
+    renderEmpty(grid, '◆', 'No resources exposed by this server', error);
     return;
   }
 
-  grid.innerHTML = resources.map((r, i) => {
-    return `<div class="card">
-      <div class="card-head">
-        <div class="card-icon resource">◆</div>
-        <div class="card-info">
-          <div class="card-name">${escHtml(r.name || r.uri)}</div>
-          <div class="card-desc">${escHtml(r.description || 'No description')}</div>
-        </div>
-      </div>
-      <div class="card-body">
-        <div class="uri-tag">${escHtml(r.uri)}</div>
-        ${r.mimeType ? `<div style="font: 400 11px var(--mono); color: var(--tx-3); margin-top: 6px;">${escHtml(r.mimeType)}</div>` : ''}
-        <button class="try-btn" onclick="readResource('${escHtml(r.uri)}', this)">◆ Read</button>
-        <div class="result-block" id="result-res-${i}"></div>
-      </div>
-    </div>`;
-  }).join('');
+  const frag = document.createDocumentFragment();
+  for (const r of resources) {
+    const card = cloneTemplate('tpl-resource');
+    card.dataset.uri = r.uri;
+    fillCard(card, r.name || r.uri, r.description);
+    card.querySelector('.uri-tag').textContent = r.uri;
+    setMime(card, r.mimeType);
+    frag.appendChild(card);
+  }
+  for (const t of templates) {
+    const card = cloneTemplate('tpl-resource');
+    card.querySelector('.card-icon').textContent = '◇';
+    fillCard(card, t.name || t.uriTemplate, t.description);
+    card.querySelector('.uri-tag').textContent = t.uriTemplate;
+    setMime(card, t.mimeType);
+    // A template needs its variables filled in before it can be read
+    card.querySelector('.try-btn').remove();
+    card.querySelector('.result-block').remove();
+    frag.appendChild(card);
+  }
+  grid.replaceChildren(frag);
 }
 
 // ── Render Prompts ──
-function renderPrompts(prompts) {
+function renderPrompts(prompts, error) {
   const grid = document.getElementById('grid-prompts');
   document.getElementById('loading-prompts').style.display = 'none';
 
   if (!prompts.length) {
-    grid.innerHTML = '<div class="empty"><div class="empty-icon">◈</div>No prompts exposed by this server</div>';
+    renderEmpty(grid, '◈', 'No prompts exposed by this server', error);
     return;
   }
 
-  grid.innerHTML = prompts.map((p, i) => {
+  const frag = document.createDocumentFragment();
+  for (const p of prompts) {
+    const card = cloneTemplate('tpl-prompt');
     const args = p.arguments || [];
-    let argsHtml = '';
-    if (args.length) {
-      argsHtml = '<div class="schema-block">' + args.map(a => {
-        const ph = (a.description || a.name).slice(0, 60);
-        return `<div class="param-row">
-          <label class="param-label"><span class="param-name">${escHtml(a.name)}</span> ${a.required ? '<span class="param-req">REQUIRED</span>' : ''}</label>
-          <input class="param-input" data-param="${escHtml(a.name)}" placeholder="${escHtml(ph)}" />
-        </div>`;
-      }).join('') + '</div>';
+    card.dataset.promptName = p.name;
+    fillCard(card, p.name, p.description);
+    setCount(card, args.length, 'argument');
+    const block = card.querySelector('.schema-block');
+    for (const a of args) {
+      block.appendChild(paramRow(a.name, a.required, a.description));
     }
-
-    return `<div class="card" data-prompt-name="${escHtml(p.name)}">
-      <div class="card-head">
-        <div class="card-icon prompt">◈</div>
-        <div class="card-info">
-          <div class="card-name">${escHtml(p.name)}</div>
-          <div class="card-desc">${escHtml(p.description || 'No description')}</div>
-        </div>
-      </div>
-      <div class="card-body">
-        ${args.length ? `<div style="font: 500 10px var(--mono); color: var(--tx-3); letter-spacing: 1px; text-transform: uppercase; margin-bottom: 2px;">${args.length} argument${args.length > 1 ? 's' : ''}</div>` : ''}
-        ${argsHtml}
-        <button class="try-btn" onclick="getPrompt(this)">◈ Get</button>
-        <div class="result-block" id="result-prompt-${i}"></div>
-      </div>
-    </div>`;
-  }).join('');
+    frag.appendChild(card);
+  }
+  grid.replaceChildren(frag);
 }
 
 // ── API Calls ──
@@ -163,7 +181,8 @@ async function tryTool(btn) {
   }
 }
 
-async function readResource(uri, btn) {
+async function readResource(btn) {
+  const uri = btn.closest('.card')?.dataset?.uri;
   const block = btn.nextElementSibling;
   block.style.display = 'block';
   block.textContent = 'Reading resource...';
@@ -209,26 +228,21 @@ async function getPrompt(btn) {
 // ── Load Everything ──
 async function init() {
   try {
-    const info = await (await fetch('/api/info')).json();
+    const { info, tools, resources, templates, prompts, errors } = await (await fetch('/api/bootstrap')).json();
     document.getElementById('stat-server').textContent = info.name || 'Unknown';
     document.getElementById('server-badge').textContent = info.command || '—';
 
-    const [tools, resources, prompts] = await Promise.all([
-      fetch('/api/tools').then(r => r.json()),
-      fetch('/api/resources').then(r => r.json()),
-      fetch('/api/prompts').then(r => r.json()),
-    ]);
-
+    const resourceCount = resources.length + templates.length;
     document.getElementById('stat-tools').textContent = tools.length;
-    document.getElementById('stat-resources').textContent = resources.length;
+    document.getElementById('stat-resources').textContent = resourceCount;
     document.getElementById('stat-prompts').textContent = prompts.length;
     document.getElementById('tab-tools-count').textContent = tools.length;
-    document.getElementById('tab-resources-count').textContent = resources.length;
+    document.getElementById('tab-resources-count').textContent = resourceCount;
     document.getElementById('tab-prompts-count').textContent = prompts.length;
 
-    renderTools(tools);
-    renderResources(resources);
-    renderPrompts(prompts);
+    renderTools(tools, errors.tools);
+    renderResources(resources, templates, errors.resources || errors.templates);
+    renderPrompts(prompts, errors.prompts);
   } catch (e) {
     console.error('Init error:', e);
     document.getElementById('server-badge').textContent = 'connection failed';